@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DEFAULT_FLAG_COUNT
 from .const import DOMAIN
 from .coordinator import SBusDataUpdateCoordinator
 
@@ -33,9 +34,9 @@ async def async_setup_entry(
 
     entities: list[BinarySensorEntity] = []
 
-    # Create binary sensor entities for flags
+    # Create binary sensor entities for the polled flag span
     # In a real implementation, this should be configurable
-    for address in range(32):  # Example: First 32 flags
+    for address in range(DEFAULT_FLAG_COUNT):
         entities.append(
             SBusFlagBinarySensor(
                 coordinator=coordinator,
@@ -82,8 +83,10 @@ class SBusFlagBinarySensor(
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        if self.coordinator.data and "flags" in self.coordinator.data:
-            return self.coordinator.data["flags"].get(self._address)
+        if self.coordinator.data:
+            flags = self.coordinator.data.get("flags", [])
+            if self._address < len(flags):
+                return flags[self._address]
         return None
 
     @property
@@ -99,5 +102,5 @@ class SBusFlagBinarySensor(
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._address in self.coordinator.data.get("flags", {})
+            and self._address < len(self.coordinator.data.get("flags", []))
         )
@@ -74,6 +74,12 @@ SYSREG_SERIAL_END: Final = 612
 SYSREG_PROTOCOL: Final = 620
 SYSREG_BAUDRATE: Final = 621
 
+# Polled data points (single source of truth for the coordinator span
+# and the entities created by the platforms)
+DEFAULT_REGISTER_COUNT: Final = 10
+DEFAULT_FLAG_COUNT: Final = 32
+DEFAULT_SWITCH_COUNT: Final = 8
+
 # Entity platforms
 PLATFORMS: Final = ["sensor", "binary_sensor", "switch"]
 
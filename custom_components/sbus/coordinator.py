@@ -4,17 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from array import array
 from datetime import timedelta
 from typing import TYPE_CHECKING
 from typing import Any
 
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.helpers.update_coordinator import UpdateFailed
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
+from .const import DEFAULT_FLAG_COUNT
+from .const import DEFAULT_REGISTER_COUNT
 from .const import DOMAIN
+from .const import MAX_REGISTER_COUNT
 from .sbus_protocol import SBusProtocolBase
 from .sbus_protocol import SBusProtocolError
 from .sbus_protocol import SBusTimeoutError
@@ -25,6 +30,10 @@ _LOGGER = logging.getLogger(__name__)
 MAX_CONSECUTIVE_ERRORS = 3
 RECONNECT_DELAY = 5  # seconds
 
+# Cooldown for entity-requested refreshes; writes to several switches in
+# quick succession then trigger a single poll instead of one each
+REQUEST_REFRESH_COOLDOWN = 1.0  # seconds
+
 
 class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching S-Bus data from the device."""
@@ -34,6 +43,8 @@ class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         protocol: SBusProtocolBase,
         scan_interval: int,
+        register_count: int = DEFAULT_REGISTER_COUNT,
+        flag_count: int = DEFAULT_FLAG_COUNT,
     ) -> None:
         """Initialize the coordinator.
 
@@ -41,6 +52,8 @@ class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             protocol: S-Bus protocol handler (any protocol variant)
             scan_interval: Update interval in seconds
+            register_count: Number of registers to poll from address 0
+            flag_count: Number of flags to poll from address 0
 
         """
         super().__init__(
@@ -48,11 +61,22 @@ class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            request_refresh_debouncer=Debouncer(
+                hass,
+                _LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=False,
+            ),
         )
         self.protocol = protocol
+        self._register_count = register_count
+        self._flag_count = flag_count
         self._device_info: dict[str, Any] | None = None
         self._consecutive_errors = 0
-        self._is_connected = False
+        # async_setup_entry connects the protocol before handing it over;
+        # starting disconnected would make the first poll tear that
+        # connection down and redial after the reconnect delay
+        self._is_connected = True
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from S-Bus device.
@@ -70,36 +94,45 @@ class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 _LOGGER.info("Attempting to reconnect to S-Bus device...")
                 await self._async_reconnect()
 
+            # Values are stored positionally: the polled spans start at
+            # address 0, so index i is address i. Registers live in a
+            # contiguous array.array of machine words and flags stay in
+            # their packed FlagView, avoiding per-entry object overhead
             data: dict[str, Any] = {
-                "registers": {},
-                "flags": {},
+                "registers": array("I"),
+                "flags": [],
                 "timers": {},
                 "counters": {},
             }
 
-            # Example: Read first 10 registers
-            # In a real implementation, this should be configurable
-            # or dynamically determined based on configured entities
-            try:
-                registers = await self.protocol.read_registers(0, 10)
-                for i, value in enumerate(registers):
-                    data["registers"][i] = value
-            except SBusTimeoutError:
+            # Issue the register and flag reads together; transports
+            # that can match responses to requests (Ether-S-Bus UDP)
+            # overlap the round trips, others serialize on their lock
+            register_result, flag_result = await asyncio.gather(
+                self._read_register_span(),
+                self.protocol.read_flags(0, self._flag_count),
+                return_exceptions=True,
+            )
+
+            if isinstance(register_result, SBusTimeoutError):
                 # Timeout is critical, re-raise
-                raise
-            except SBusProtocolError as err:
-                _LOGGER.debug("Could not read registers: %s", err)
-
-            # Example: Read first 32 flags
-            try:
-                flags = await self.protocol.read_flags(0, 32)
-                for i, value in enumerate(flags):
-                    data["flags"][i] = value
-            except SBusTimeoutError:
+                raise register_result
+            if isinstance(register_result, SBusProtocolError):
+                _LOGGER.debug("Could not read registers: %s", register_result)
+            elif isinstance(register_result, BaseException):
+                raise register_result
+            else:
+                data["registers"] = register_result
+
+            if isinstance(flag_result, SBusTimeoutError):
                 # Timeout is critical, re-raise
-                raise
-            except SBusProtocolError as err:
-                _LOGGER.debug("Could not read flags: %s", err)
+                raise flag_result
+            if isinstance(flag_result, SBusProtocolError):
+                _LOGGER.debug("Could not read flags: %s", flag_result)
+            elif isinstance(flag_result, BaseException):
+                raise flag_result
+            else:
+                data["flags"] = flag_result
 
             # Reset error counter on success
             self._consecutive_errors = 0
@@ -128,6 +161,26 @@ class SBusDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             )
             raise UpdateFailed(msg) from err
 
+    async def _read_register_span(self) -> array[int]:
+        """Read the polled register span.
+
+        Reads in as few telegrams as possible (one per MAX_REGISTER_COUNT
+        chunk).
+
+        Returns:
+            Register values for addresses 0 to register_count - 1
+
+        """
+        values = array("I")
+        address = 0
+        remaining = self._register_count
+        while remaining > 0:
+            chunk = min(remaining, MAX_REGISTER_COUNT)
+            values.extend(await self.protocol.read_registers(address, chunk))
+            address += chunk
+            remaining -= chunk
+        return values
+
     async def _async_reconnect(self) -> None:
         """Attempt to reconnect to the device.
 
@@ -7,6 +7,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import socket
+from itertools import count
 from typing import TYPE_CHECKING
 
 from .const import DEFAULT_TIMEOUT
@@ -54,8 +56,11 @@ class EtherSBusProtocol(SBusProtocolBase):
         )
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
-        self._sequence_number: int = 0
+        self._sequence_number = 0
         self._max_retries: int = 3
+        # In-flight UDP requests keyed by telegram counter; the device
+        # echoes the counter, so responses can be matched to requests
+        self._pending: dict[int, asyncio.Future[bytes]] = {}
 
     async def connect(self) -> None:
         """Establish connection to the S-Bus device via Ether-S-Bus."""
@@ -70,7 +75,7 @@ class EtherSBusProtocol(SBusProtocolBase):
 
         def protocol_factory() -> _EtherSBusDatagramProtocol:
             """Create protocol instance."""
-            self._protocol = _EtherSBusDatagramProtocol()
+            self._protocol = _EtherSBusDatagramProtocol(self._pending)
             return self._protocol
 
         transport, _ = await loop.create_datagram_endpoint(
@@ -87,11 +92,24 @@ class EtherSBusProtocol(SBusProtocolBase):
         )
 
     async def _connect_tcp(self) -> None:
-        """Establish TCP connection."""
-        self._reader, self._writer = await asyncio.open_connection(
-            self.host,
-            self.port,
-        )
+        """Establish TCP connection.
+
+        Connects on a pre-created non-blocking socket via
+        loop.sock_connect so keepalive can be enabled before the streams
+        layer takes ownership; a dead link is then detected by the kernel
+        instead of waiting for the next poll to time out.
+        """
+        loop = asyncio.get_running_loop()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        try:
+            async with asyncio.timeout(self.timeout):
+                await loop.sock_connect(sock, (self.host, self.port))
+        except (TimeoutError, OSError):
+            sock.close()
+            raise
+        self._reader, self._writer = await asyncio.open_connection(sock=sock)
 
         _LOGGER.debug(
             "Connected to %s:%d via TCP (station %d)",
@@ -119,7 +137,11 @@ class EtherSBusProtocol(SBusProtocolBase):
             self.station,
         )
 
-    async def _send_and_receive(self, telegram: bytes) -> bytes:
+    async def _send_and_receive(
+        self,
+        telegram: bytes,
+        response_len: int | None = None,
+    ) -> bytes:
         """Send telegram and receive response via Ether-S-Bus with retry logic.
 
         Implements automatic retry on timeout with exponential backoff.
@@ -127,6 +149,8 @@ class EtherSBusProtocol(SBusProtocolBase):
 
         Args:
             telegram: The telegram to send
+            response_len: Expected response size; the TCP path uses it
+                for an exact framed read (UDP datagrams frame themselves)
 
         Returns:
             The response telegram
@@ -139,7 +163,7 @@ class EtherSBusProtocol(SBusProtocolBase):
         for attempt in range(self._max_retries):
             try:
                 if self.use_tcp:
-                    return await self._send_and_receive_tcp(telegram)
+                    return await self._send_and_receive_tcp(telegram, response_len)
                 return await self._send_and_receive_udp(telegram)
             except SBusTimeoutError as err:
                 last_error = err
@@ -166,6 +190,46 @@ class EtherSBusProtocol(SBusProtocolBase):
         msg = f"Communication failed after {self._max_retries} attempts"
         raise SBusTimeoutError(msg)
 
+    async def _request(
+        self,
+        telegram: bytes,
+        response_len: int | None = None,
+    ) -> bytes:
+        """Perform one request/response exchange.
+
+        UDP responses echo the telegram counter, so concurrent requests
+        can be pipelined instead of serialized: each request awaits its
+        own future, resolved by the datagram handler. TCP responses carry
+        no such correlation and keep the serializing lock from the base
+        class.
+
+        Args:
+            telegram: The telegram to send
+            response_len: Expected response size in bytes
+
+        Returns:
+            The response telegram
+
+        """
+        if self.use_tcp:
+            return await super()._request(telegram, response_len)
+        return await self._send_and_receive(telegram, response_len)
+
+    def _device_info_key(self) -> tuple[str, str, int, int]:
+        """Return the cache key identifying this device."""
+        return (type(self).__name__, self.host, self.port, self.station)
+
+    @property
+    def _sequence_number(self) -> int:
+        """Return the most recently issued sequence number."""
+        return self._last_sequence
+
+    @_sequence_number.setter
+    def _sequence_number(self, value: int) -> None:
+        """Reset the sequence counter to continue after `value`."""
+        self._last_sequence = value
+        self._seq_counter = count(value + 1)
+
     def _get_next_sequence(self) -> int:
         """Get next sequence number for Ether-S-Bus packets.
 
@@ -173,8 +237,10 @@ class EtherSBusProtocol(SBusProtocolBase):
             Next sequence number (0-65535, wraps around)
 
         """
-        self._sequence_number = (self._sequence_number + 1) % 65536
-        return self._sequence_number
+        # itertools.count keeps the increment in C instead of doing a
+        # load/add/modulo/store dance per telegram
+        self._last_sequence = next(self._seq_counter) & 0xFFFF
+        return self._last_sequence
 
     async def _send_and_receive_udp(self, telegram: bytes) -> bytes:
         """Send and receive via UDP."""
@@ -182,38 +248,50 @@ class EtherSBusProtocol(SBusProtocolBase):
             msg = "Not connected to device"
             raise SBusTimeoutError(msg)
 
-        _LOGGER.debug("Sending UDP telegram: %s", telegram.hex())
-
-        # Clear any pending responses
-        self._protocol.clear_response()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending UDP telegram: %s", telegram.hex())
 
-        # Send telegram (type ignore for DatagramTransport)
-        if isinstance(self._transport, asyncio.DatagramTransport):
-            self._transport.sendto(telegram)  # type: ignore[attr-defined]
-        else:
-            msg = "Transport is not a DatagramTransport"
-            raise SBusTimeoutError(msg)
+        # Register the future before sending so a fast response cannot
+        # arrive between send and wait
+        counter = telegram[0]
+        future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+        self._pending[counter] = future
 
-        # Wait for response with timeout
         try:
-            response = await asyncio.wait_for(
-                self._protocol.get_response(),
-                timeout=self.timeout,
-            )
-            _LOGGER.debug("Received UDP response: %s", response.hex())
+            # Send telegram (type ignore for DatagramTransport)
+            if isinstance(self._transport, asyncio.DatagramTransport):
+                self._transport.sendto(telegram)  # type: ignore[attr-defined]
+            else:
+                msg = "Transport is not a DatagramTransport"
+                raise SBusTimeoutError(msg)
+
+            # Wait for the matching response with timeout; the timeout
+            # scope runs on the current task, avoiding the wrapper task
+            # wait_for would spawn per telegram
+            async with asyncio.timeout(self.timeout):
+                response = await future
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received UDP response: %s", response.hex())
             return response
 
         except TimeoutError as err:
             msg = f"Timeout waiting for response from {self.host}:{self.port}"
             raise SBusTimeoutError(msg) from err
+        finally:
+            self._pending.pop(counter, None)
 
-    async def _send_and_receive_tcp(self, telegram: bytes) -> bytes:
+    async def _send_and_receive_tcp(
+        self,
+        telegram: bytes,
+        response_len: int | None = None,
+    ) -> bytes:
         """Send and receive via TCP."""
         if not self._reader or not self._writer:
             msg = "Not connected to device"
             raise SBusTimeoutError(msg)
 
-        _LOGGER.debug("Sending TCP telegram: %s", telegram.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending TCP telegram: %s", telegram.hex())
 
         # Send telegram
         self._writer.write(telegram)
@@ -221,14 +299,20 @@ class EtherSBusProtocol(SBusProtocolBase):
 
         # Wait for response with timeout
         try:
-            # Read at least minimum telegram size
-            response = await asyncio.wait_for(
-                self._reader.read(1024),
-                timeout=self.timeout,
-            )
-            _LOGGER.debug("Received TCP response: %s", response.hex())
+            async with asyncio.timeout(self.timeout):
+                if response_len is not None:
+                    # Framed read: TCP is a byte stream, so read exactly
+                    # the expected response instead of whatever arrived
+                    response = await self._reader.readexactly(response_len)
+                else:
+                    response = await self._reader.read(1024)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received TCP response: %s", response.hex())
             return response
 
+        except asyncio.IncompleteReadError as err:
+            msg = f"Connection to {self.host}:{self.port} closed mid-response"
+            raise SBusTimeoutError(msg) from err
         except TimeoutError as err:
             msg = f"Timeout waiting for response from {self.host}:{self.port}"
             raise SBusTimeoutError(msg) from err
@@ -237,9 +321,15 @@ class EtherSBusProtocol(SBusProtocolBase):
 class _EtherSBusDatagramProtocol(asyncio.DatagramProtocol):
     """Internal protocol handler for UDP communication."""
 
-    def __init__(self) -> None:
-        """Initialize the protocol handler."""
-        self._response_queue: asyncio.Queue[bytes] = asyncio.Queue()
+    def __init__(self, pending: dict[int, asyncio.Future[bytes]]) -> None:
+        """Initialize the protocol handler.
+
+        Args:
+            pending: In-flight requests keyed by telegram counter, shared
+                with the owning protocol instance
+
+        """
+        self._pending = pending
         self._transport: asyncio.DatagramTransport | None = None
 
     def connection_made(self, transport: asyncio.BaseTransport) -> None:
@@ -248,25 +338,28 @@ class _EtherSBusDatagramProtocol(asyncio.DatagramProtocol):
 
     def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
         """Called when a datagram is received."""
-        _LOGGER.debug("Received datagram from %s:%d: %s", addr[0], addr[1], data.hex())
-        self._response_queue.put_nowait(data)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received datagram from %s:%d: %s",
+                addr[0],
+                addr[1],
+                data.hex(),
+            )
+        # Route the response to the request whose counter it echoes;
+        # unmatched datagrams (responses to timed-out requests, stray
+        # traffic) are dropped — nothing consumes them anymore, and
+        # queueing them would leak for the lifetime of the connection
+        if data:
+            future = self._pending.pop(data[0], None)
+            if future is not None and not future.done():
+                future.set_result(data)
+                return
+        _LOGGER.debug("Dropping unmatched datagram (%d bytes)", len(data))
 
     def error_received(self, exc: Exception) -> None:
         """Called when an error is received."""
         _LOGGER.error("Datagram error received: %s", exc)
 
-    async def get_response(self) -> bytes:
-        """Wait for and return the next response."""
-        return await self._response_queue.get()
-
-    def clear_response(self) -> None:
-        """Clear any pending responses in the queue."""
-        while not self._response_queue.empty():
-            try:
-                self._response_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
 
 class _EtherSBusStreamProtocol(asyncio.Protocol):
     """Internal protocol handler for TCP communication."""
@@ -282,7 +375,8 @@ class _EtherSBusStreamProtocol(asyncio.Protocol):
 
     def data_received(self, data: bytes) -> None:
         """Called when data is received."""
-        _LOGGER.debug("Received data: %s", data.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Received data: %s", data.hex())
         self._response_queue.put_nowait(data)
 
     def error_received(self, exc: Exception) -> None:
@@ -85,11 +85,27 @@ class ProfiSBusProtocol(SBusProtocolBase):
             self.station,
         )
 
-    async def _send_and_receive(self, telegram: bytes) -> bytes:
+    def _device_info_key(self) -> tuple[str, str, int, int, int]:
+        """Return the cache key identifying this device."""
+        return (
+            type(self).__name__,
+            self.host,
+            self.port,
+            self.profibus_address,
+            self.station,
+        )
+
+    async def _send_and_receive(
+        self,
+        telegram: bytes,
+        response_len: int | None = None,
+    ) -> bytes:
         """Send telegram and receive response via Profi-S-Bus.
 
         Args:
             telegram: The telegram to send
+            response_len: Expected S-Bus response size (without the
+                gateway header) for an exact framed read
 
         Returns:
             The response telegram
@@ -102,7 +118,8 @@ class ProfiSBusProtocol(SBusProtocolBase):
             msg = "Not connected to device"
             raise SBusTimeoutError(msg)
 
-        _LOGGER.debug("Sending Profibus telegram: %s", telegram.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending Profibus telegram: %s", telegram.hex())
 
         # Wrap telegram with Profibus gateway protocol
         # This is a simplified example - actual implementation depends on gateway
@@ -114,17 +131,26 @@ class ProfiSBusProtocol(SBusProtocolBase):
 
         # Wait for response with timeout
         try:
-            response_wrapped = await asyncio.wait_for(
-                self._reader.read(1024),
-                timeout=self.timeout,
-            )
+            async with asyncio.timeout(self.timeout):
+                if response_len is not None:
+                    # Gateway responses carry a 2-byte header in front
+                    # of the S-Bus telegram
+                    response_wrapped = await self._reader.readexactly(
+                        response_len + 2
+                    )
+                else:
+                    response_wrapped = await self._reader.read(1024)
 
             # Unwrap Profibus protocol
             response = self._unwrap_profibus(response_wrapped)
 
-            _LOGGER.debug("Received Profibus response: %s", response.hex())
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received Profibus response: %s", response.hex())
             return response
 
+        except asyncio.IncompleteReadError as err:
+            msg = f"Connection to {self.host}:{self.port} closed mid-response"
+            raise SBusTimeoutError(msg) from err
         except TimeoutError as err:
             msg = f"Timeout waiting for response from {self.host}:{self.port}"
             raise SBusTimeoutError(msg) from err
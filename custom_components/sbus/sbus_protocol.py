@@ -23,6 +23,7 @@ from .const import PROTOCOL_PROFI_SBUS
 from .const import PROTOCOL_SERIAL_SBUS
 from .ether_sbus import EtherSBusProtocol
 from .profi_sbus import ProfiSBusProtocol
+from .sbus_protocol_base import FlagView
 from .sbus_protocol_base import SBusCRCError
 from .sbus_protocol_base import SBusProtocolBase
 from .sbus_protocol_base import SBusProtocolError
@@ -30,6 +31,7 @@ from .sbus_protocol_base import SBusTimeoutError
 from .serial_sbus import SerialSBusProtocol
 
 __all__ = [
+    "FlagView",
     "SBusProtocol",
     "EtherSBusProtocol",
     "SerialSBusProtocol",
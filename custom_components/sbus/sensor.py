@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DEFAULT_REGISTER_COUNT
 from .const import DOMAIN
 from .coordinator import SBusDataUpdateCoordinator
 
@@ -34,9 +35,9 @@ async def async_setup_entry(
 
     entities: list[SensorEntity] = []
 
-    # Create sensor entities for registers
+    # Create sensor entities for the polled register span
     # In a real implementation, this should be configurable
-    for address in range(10):  # Example: First 10 registers
+    for address in range(DEFAULT_REGISTER_COUNT):
         entities.append(
             SBusRegisterSensor(
                 coordinator=coordinator,
@@ -81,8 +82,10 @@ class SBusRegisterSensor(CoordinatorEntity[SBusDataUpdateCoordinator], SensorEnt
     @property
     def native_value(self) -> int | None:
         """Return the state of the sensor."""
-        if self.coordinator.data and "registers" in self.coordinator.data:
-            return self.coordinator.data["registers"].get(self._address)
+        if self.coordinator.data:
+            registers = self.coordinator.data.get("registers", [])
+            if self._address < len(registers):
+                return registers[self._address]
         return None
 
     @property
@@ -98,5 +101,5 @@ class SBusRegisterSensor(CoordinatorEntity[SBusDataUpdateCoordinator], SensorEnt
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._address in self.coordinator.data.get("registers", {})
+            and self._address < len(self.coordinator.data.get("registers", []))
         )
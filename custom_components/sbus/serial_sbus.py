@@ -51,6 +51,7 @@ class SerialSBusProtocol(SBusProtocolBase):
         self._reader: asyncio.StreamReader | None = None
         self._writer: asyncio.StreamWriter | None = None
         self._serial = None
+        self._resync_needed = False
 
     async def connect(self) -> None:
         """Establish connection to the S-Bus device via Serial-S-Bus."""
@@ -119,11 +120,20 @@ class SerialSBusProtocol(SBusProtocolBase):
             self.station,
         )
 
-    async def _send_and_receive(self, telegram: bytes) -> bytes:
+    def _device_info_key(self) -> tuple[str, str, int]:
+        """Return the cache key identifying this device."""
+        return (type(self).__name__, self.port, self.station)
+
+    async def _send_and_receive(
+        self,
+        telegram: bytes,
+        response_len: int | None = None,
+    ) -> bytes:
         """Send telegram and receive response via Serial-S-Bus.
 
         Args:
             telegram: The telegram to send
+            response_len: Expected response size for an exact framed read
 
         Returns:
             The response telegram
@@ -136,16 +146,18 @@ class SerialSBusProtocol(SBusProtocolBase):
             msg = "Not connected to device"
             raise SBusTimeoutError(msg)
 
-        _LOGGER.debug("Sending serial telegram: %s", telegram.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Sending serial telegram: %s", telegram.hex())
 
-        # Clear input buffer if possible
-        try:
-            if hasattr(self._reader, "_buffer") and hasattr(
-                self._reader._buffer, "clear"  # type: ignore[attr-defined] # noqa: SLF001
-            ):
-                self._reader._buffer.clear()  # type: ignore[attr-defined] # noqa: SLF001
-        except Exception:
-            pass  # Ignore if buffer clearing fails
+        # After a timeout the line may still carry bytes of the aborted
+        # exchange; drain them once before resuming normal framed reads
+        if self._resync_needed:
+            try:
+                async with asyncio.timeout(0.01):
+                    await self._reader.read(4096)
+            except TimeoutError:
+                pass
+            self._resync_needed = False
 
         # Send telegram
         self._writer.write(telegram)
@@ -153,14 +165,24 @@ class SerialSBusProtocol(SBusProtocolBase):
 
         # Wait for response with timeout
         try:
-            # Read minimum telegram size first
-            response = await asyncio.wait_for(
-                self._reader.read(1024),
-                timeout=self.timeout,
-            )
-            _LOGGER.debug("Received serial response: %s", response.hex())
+            async with asyncio.timeout(self.timeout):
+                if response_len is not None:
+                    # Framed read: return as soon as the expected number
+                    # of bytes arrived instead of waiting out the timeout
+                    # on a bulk read (serial has no EOF to end a
+                    # read(1024) early)
+                    response = await self._reader.readexactly(response_len)
+                else:
+                    response = await self._reader.read(1024)
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Received serial response: %s", response.hex())
             return response
 
+        except asyncio.IncompleteReadError as err:
+            self._resync_needed = True
+            msg = f"Connection to {self.port} closed mid-response"
+            raise SBusTimeoutError(msg) from err
         except TimeoutError as err:
+            self._resync_needed = True
             msg = f"Timeout waiting for response from {self.port}"
             raise SBusTimeoutError(msg) from err
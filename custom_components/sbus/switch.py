@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import DEFAULT_SWITCH_COUNT
 from .const import DOMAIN
 from .coordinator import SBusDataUpdateCoordinator
 from .sbus_protocol import SBusProtocol
@@ -38,7 +39,7 @@ async def async_setup_entry(
 
     # Create switch entities for writable flags
     # In a real implementation, this should be configurable
-    for address in range(8):  # Example: First 8 flags as switches
+    for address in range(DEFAULT_SWITCH_COUNT):
         entities.append(
             SBusFlagSwitch(
                 coordinator=coordinator,
@@ -85,8 +86,10 @@ class SBusFlagSwitch(CoordinatorEntity[SBusDataUpdateCoordinator], SwitchEntity)
     @property
     def is_on(self) -> bool | None:
         """Return true if the switch is on."""
-        if self.coordinator.data and "flags" in self.coordinator.data:
-            return self.coordinator.data["flags"].get(self._address)
+        if self.coordinator.data:
+            flags = self.coordinator.data.get("flags", [])
+            if self._address < len(flags):
+                return flags[self._address]
         return None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
@@ -120,5 +123,5 @@ class SBusFlagSwitch(CoordinatorEntity[SBusDataUpdateCoordinator], SwitchEntity)
         """Return if entity is available."""
         return (
             self.coordinator.last_update_success
-            and self._address in self.coordinator.data.get("flags", {})
+            and self._address < len(self.coordinator.data.get("flags", []))
         )
@@ -2,14 +2,175 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from typing import TYPE_CHECKING
+from typing import Any
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.sbus.const import ATTR_ACK
+from custom_components.sbus.const import ATTR_RESPONSE
 from custom_components.sbus.const import DOMAIN
+from custom_components.sbus.const import MIN_TELEGRAM_SIZE
+from custom_components.sbus.sbus_protocol import FlagView
+from custom_components.sbus.sbus_protocol import SBusProtocol
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+# Default protocol payloads, built once and shared across tests; the
+# flag bitmap mirrors the packed layout the production code returns
+_ZERO_REGISTERS = [0] * 10
+_ALL_OFF_FLAGS = FlagView(b"\x00" * 4, 32)
+
+
+class FakeStream:
+    """In-memory stand-in for an asyncio StreamReader/StreamWriter pair.
+
+    Serves canned response telegrams to the protocol's real send/receive
+    path, so transport tests run without AsyncMock call bookkeeping or
+    real sockets. Written telegrams are recorded for assertions.
+    """
+
+    def __init__(self, canned: list[bytes] | None = None) -> None:
+        """Initialize with optional canned response telegrams."""
+        self._buffer = bytearray()
+        for telegram in canned or []:
+            self._buffer.extend(telegram)
+        self.written: list[bytes] = []
+
+    def feed(self, data: bytes) -> None:
+        """Queue more response bytes."""
+        self._buffer.extend(data)
+
+    async def readexactly(self, n: int) -> bytes:
+        """Return exactly n buffered bytes or raise IncompleteReadError."""
+        if len(self._buffer) < n:
+            raise asyncio.IncompleteReadError(bytes(self._buffer), n)
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    async def read(self, n: int = -1) -> bytes:
+        """Return up to n buffered bytes (all of them for n < 0)."""
+        if n < 0 or n >= len(self._buffer):
+            data = bytes(self._buffer)
+            self._buffer.clear()
+            return data
+        data = bytes(self._buffer[:n])
+        del self._buffer[:n]
+        return data
+
+    def write(self, data: bytes) -> None:
+        """Record an outgoing telegram."""
+        self.written.append(bytes(data))
+
+    async def drain(self) -> None:
+        """No-op flush."""
+
+    def close(self) -> None:
+        """No-op close."""
+
+    async def wait_closed(self) -> None:
+        """No-op close wait."""
+
+
+class _FakeCall:
+    """Awaitable method stub compatible with the AsyncMock test idioms.
+
+    Supports the `.return_value` / `.side_effect` / `.called` attributes
+    the tests already use, without MagicMock's per-call spec walking and
+    call-record bookkeeping on every coordinator refresh.
+    """
+
+    def __init__(self, return_value: Any = None) -> None:
+        """Initialize with a default return value."""
+        self.return_value = return_value
+        self.side_effect: BaseException | None = None
+        self.called = False
+        self.call_count = 0
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Record the call and return or raise the configured result."""
+        self.called = True
+        self.call_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def assert_called(self) -> None:
+        """Assert the method was called at least once."""
+        assert self.called
+
+    def assert_called_once(self) -> None:
+        """Assert the method was called exactly once."""
+        assert self.call_count == 1
+
+
+class FakeProtocol:
+    """Hand-written protocol double for the platform and coordinator tests."""
+
+    def __init__(self) -> None:
+        """Initialize with benign defaults for every protocol method."""
+        self.connect = _FakeCall()
+        self.disconnect = _FakeCall()
+        self.get_device_info = _FakeCall(
+            return_value={
+                "firmware_version": 100,
+                "product_type": "PCD1.M2120",
+                "hw_version": 1,
+                "serial_number": "12345678ABCDEF12",
+            }
+        )
+        self.read_registers = _FakeCall(return_value=_ZERO_REGISTERS)
+        self.read_flags = _FakeCall(return_value=_ALL_OFF_FLAGS)
+        self.write_register = _FakeCall()
+        self.write_flag = _FakeCall()
+
+
+def make_canned_response(
+    protocol: SBusProtocol,
+    data: bytes = b"",
+    attr: int = ATTR_RESPONSE,
+) -> bytes:
+    """Build a valid response telegram with a correct CRC.
+
+    Args:
+        protocol: Protocol whose station and CRC routine to use
+        data: Response payload
+        attr: Attribute byte (response or acknowledge)
+
+    Returns:
+        Complete telegram, padded to the minimum telegram size
+
+    """
+    body = bytes([0, protocol.station, attr, 0, 0, 0, 0, 0]) + data
+    if len(body) + 2 < MIN_TELEGRAM_SIZE:
+        body += b"\x00" * (MIN_TELEGRAM_SIZE - 2 - len(body))
+    crc = protocol.calculate_crc(body)
+    return body + crc.to_bytes(2, "big")
+
+
+@pytest.fixture(scope="session")
+def canned_telegrams() -> dict[str, bytes]:
+    """Return fixed response telegrams, built once per test session.
+
+    The repeated response shapes (register block, flag byte, acknowledge)
+    are identical across tests, so the header packing and CRC are paid
+    once here instead of per test.
+    """
+    protocol = SBusProtocol("localhost", 5050, 0, use_tcp=True)
+    return {
+        "read_registers_3": make_canned_response(
+            protocol,
+            b"\x00\x00\x00\x64" + b"\x00\x00\x00\xc8" + b"\x00\x00\x01\x2c",
+        ),
+        "read_flags_8": make_canned_response(protocol, b"\xaa"),
+        "ack": make_canned_response(protocol, attr=ATTR_ACK),
+    }
 
 
 @pytest.fixture
@@ -30,24 +191,43 @@ def mock_config_entry() -> MockConfigEntry:
 
 @pytest.fixture
 def mock_sbus_protocol():
-    """Mock the S-Bus protocol class."""
-    with patch("custom_components.sbus.sbus_protocol.SBusProtocol") as mock:
-        protocol = mock.return_value
-        protocol.connect = AsyncMock()
-        protocol.disconnect = AsyncMock()
-        protocol.get_device_info = AsyncMock(
-            return_value={
-                "firmware_version": 100,
-                "product_type": "PCD1.M2120",
-                "hw_version": 1,
-                "serial_number": "12345678ABCDEF12",
-            }
-        )
-        protocol.read_registers = AsyncMock(return_value=[0] * 10)
-        protocol.read_flags = AsyncMock(return_value=[False] * 32)
-        protocol.write_register = AsyncMock()
-        protocol.write_flag = AsyncMock()
-        yield protocol
+    """Return a protocol double for the integration tests."""
+    return FakeProtocol()
+
+
+@pytest.fixture
+def patched_create_protocol(mock_sbus_protocol):
+    """Patch the protocol factory used by the integration setup.
+
+    async_setup_entry builds its protocol through create_sbus_protocol,
+    so that is the seam to replace with the fake; a single fixture
+    installs the patch instead of each test re-opening its own block.
+    """
+    with patch(
+        "custom_components.sbus.create_sbus_protocol",
+        return_value=mock_sbus_protocol,
+    ) as patched:
+        yield patched
+
+
+@pytest.fixture
+async def init_integration(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_sbus_protocol: FakeProtocol,
+    patched_create_protocol: MagicMock,
+) -> MockConfigEntry:
+    """Set up the integration with the default protocol responses.
+
+    Config-entry setup is the heaviest step of every platform test and
+    was repeated verbatim in each; doing it here keeps the tests down to
+    the state changes they actually exercise. The Home Assistant harness
+    recreates `hass` per test, so this stays function-scoped.
+    """
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return mock_config_entry
 
 
 @pytest.fixture
@@ -9,15 +9,15 @@ from custom_components.sbus.sbus_protocol import SBusProtocolError
 from custom_components.sbus.sbus_protocol import SBusTimeoutError
 
 if TYPE_CHECKING:
-    from unittest.mock import AsyncMock
-
     from homeassistant.core import HomeAssistant
     from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+    from .conftest import FakeProtocol
+
 
 async def test_coordinator_update_success(
     hass: HomeAssistant,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
     mock_config_entry: MockConfigEntry,
 ) -> None:
     """Test successful coordinator update."""
@@ -36,13 +36,13 @@ async def test_coordinator_update_success(
     assert coordinator.data is not None
     assert "registers" in coordinator.data
     assert "flags" in coordinator.data
-    assert coordinator.data["registers"] == {0: 100, 1: 200, 2: 300}
-    assert coordinator.data["flags"] == {0: True, 1: False, 2: True, 3: False}
+    assert list(coordinator.data["registers"]) == [100, 200, 300]
+    assert list(coordinator.data["flags"]) == [True, False, True, False]
 
 
 async def test_coordinator_update_timeout(
     hass: HomeAssistant,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
     mock_config_entry: MockConfigEntry,
 ) -> None:
     """Test coordinator handles timeout."""
@@ -63,7 +63,7 @@ async def test_coordinator_update_timeout(
 
 async def test_coordinator_update_protocol_error(
     hass: HomeAssistant,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
     mock_config_entry: MockConfigEntry,
 ) -> None:
     """Test coordinator handles protocol errors gracefully."""
@@ -88,7 +88,7 @@ async def test_coordinator_update_protocol_error(
 
 async def test_coordinator_partial_data(
     hass: HomeAssistant,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
     mock_config_entry: MockConfigEntry,
 ) -> None:
     """Test coordinator continues with partial data if flags fail."""
@@ -106,6 +106,6 @@ async def test_coordinator_partial_data(
 
     assert coordinator.data is not None
     assert "registers" in coordinator.data
-    assert coordinator.data["registers"] == {0: 100, 1: 200, 2: 300}
+    assert list(coordinator.data["registers"]) == [100, 200, 300]
     # Flags should still be present but empty/default
     assert "flags" in coordinator.data
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock
+from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from custom_components.sbus.const import DOMAIN
@@ -13,29 +14,28 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+    from .conftest import FakeProtocol
+
 
 async def test_setup_entry_success(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
+    patched_create_protocol: MagicMock,
 ) -> None:
     """Test successful setup of the integration."""
     mock_config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.sbus.SBusProtocol",
-        return_value=mock_sbus_protocol,
-    ):
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
 
-        # Verify protocol methods were called
-        mock_sbus_protocol.connect.assert_called_once()
-        mock_sbus_protocol.get_device_info.assert_called_once()
+    # Verify protocol methods were called
+    mock_sbus_protocol.connect.assert_called_once()
+    mock_sbus_protocol.get_device_info.assert_called_once()
 
-        # Verify data is stored
-        assert DOMAIN in hass.data
-        assert mock_config_entry.entry_id in hass.data[DOMAIN]
+    # Verify data is stored
+    assert DOMAIN in hass.data
+    assert mock_config_entry.entry_id in hass.data[DOMAIN]
 
 
 async def test_setup_entry_connection_failed(
@@ -49,7 +49,7 @@ async def test_setup_entry_connection_failed(
     mock_protocol.connect.side_effect = SBusProtocolError("Connection failed")
 
     with patch(
-        "custom_components.sbus.SBusProtocol",
+        "custom_components.sbus.create_sbus_protocol",
         return_value=mock_protocol,
     ):
         assert not await hass.config_entries.async_setup(mock_config_entry.entry_id)
@@ -62,21 +62,18 @@ async def test_setup_entry_connection_failed(
 async def test_unload_entry(
     hass: HomeAssistant,
     mock_config_entry: MockConfigEntry,
-    mock_sbus_protocol: AsyncMock,
+    mock_sbus_protocol: FakeProtocol,
+    patched_create_protocol: MagicMock,
 ) -> None:
     """Test unloading the integration."""
     mock_config_entry.add_to_hass(hass)
 
-    with patch(
-        "custom_components.sbus.SBusProtocol",
-        return_value=mock_sbus_protocol,
-    ):
-        assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
 
-        # Now unload
-        assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
-        await hass.async_block_till_done()
+    # Now unload
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
 
-        # Verify protocol disconnect was called
-        mock_sbus_protocol.disconnect.assert_called()
+    # Verify protocol disconnect was called
+    mock_sbus_protocol.disconnect.assert_called()